@@ -14,6 +14,8 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 
 
 from abc import ABC, abstractmethod
+from typing import Dict
+
 import numpy as np
 
 class Algorithm(ABC):
@@ -59,3 +61,26 @@ class Algorithm(ABC):
         """
         self.counts = np.zeros(self.k, dtype=int)
         self.values = np.zeros(self.k, dtype=float)
+
+    def get_params(self) -> Dict[str, float]:
+        """
+        Devuelve los hiperparámetros del algoritmo, que identifican su configuración pero no su estado.
+        Las subclases con parámetros adicionales deben sobrescribir este método.
+        :return: Diccionario con los hiperparámetros del algoritmo.
+        """
+        return {}
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """
+        Devuelve el estado interno (mutable) del algoritmo para poder guardarlo en un checkpoint.
+        :return: Diccionario con el estado del algoritmo como arrays de numpy.
+        """
+        return {'counts': self.counts.copy(), 'values': self.values.copy()}
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        """
+        Restaura el estado interno del algoritmo a partir de un checkpoint.
+        :param state: Diccionario con el estado generado por get_state.
+        """
+        self.counts = np.array(state['counts'], dtype=int)
+        self.values = np.array(state['values'], dtype=float)
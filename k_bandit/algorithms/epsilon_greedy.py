@@ -12,6 +12,8 @@ with the additional restriction that it may not be used for commercial purposes.
 For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 
+from typing import Dict
+
 import numpy as np
 
 from algorithms.algorithm import Algorithm
@@ -46,6 +48,13 @@ class EpsilonGreedy(Algorithm):
 
         return chosen_arm
 
+    def get_params(self) -> Dict[str, float]:
+        """
+        Devuelve los hiperparámetros del algoritmo.
+        :return: Diccionario con el parámetro epsilon.
+        """
+        return {'epsilon': self.epsilon}
+
 
 
 
@@ -0,0 +1,178 @@
+"""
+Module: check_checkpoint.py
+Description: Script de comprobación del checkpoint de run_experiment.
+Verifica que un experimento interrumpido y reanudado desde su checkpoint produce exactamente los mismos
+resultados que uno ininterrumpido, y que se rechazan los checkpoints de otra configuración y los
+valores no válidos de checkpoint_every.
+
+Uso: python check_checkpoint.py
+
+Author: agent
+Email: agent@local
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+from typing import List, Optional
+
+import numpy as np
+
+from algorithms import EpsilonGreedy
+from arms import ArmNormal, Bandit
+from main import run_experiment, parse_args
+
+K = 5
+STEPS = 50
+RUNS = 10
+CHECKPOINT_EVERY = 3
+
+
+class Interrupted(Exception):
+    """
+    Simula una interrupción (caída o expulsión del proceso) durante el experimento.
+    """
+
+
+def setup(seed: int, epsilons: Optional[List[float]] = None):
+    """
+    Prepara el bandit y los algoritmos igual que main(): semilla, generación de brazos y algoritmos.
+
+    :param seed: Semilla del generador aleatorio.
+    :param epsilons: Opcional. Valores de epsilon de los algoritmos.
+    :return: Tupla (bandit, algoritmos).
+    """
+    np.random.seed(seed)
+    bandit = Bandit(arms=ArmNormal.generate_arms(K))
+    algorithms = [EpsilonGreedy(k=K, epsilon=epsilon) for epsilon in (epsilons or [0, 0.01, 0.1])]
+    return bandit, algorithms
+
+
+def run_interrupted(path: str, seed: int, interrupt_after_pulls: int):
+    """
+    Ejecuta el experimento con checkpoint y lo interrumpe tras un número de tiradas de brazos.
+
+    :param path: Ruta del fichero de checkpoint.
+    :param seed: Semilla del generador aleatorio.
+    :param interrupt_after_pulls: Número de tiradas tras las que se interrumpe el experimento.
+    """
+    original_pull = ArmNormal.pull
+    pulls = 0
+
+    def pull(arm):
+        nonlocal pulls
+        pulls += 1
+        if pulls > interrupt_after_pulls:
+            raise Interrupted()
+        return original_pull(arm)
+
+    bandit, algorithms = setup(seed)
+    ArmNormal.pull = pull
+    try:
+        run_experiment(bandit, algorithms, STEPS, RUNS, checkpoint_path=path,
+                       checkpoint_every=CHECKPOINT_EVERY, seed=seed)
+    except Interrupted:
+        pass
+    else:
+        raise AssertionError("El experimento debería haberse interrumpido.")
+    finally:
+        ArmNormal.pull = original_pull
+
+
+def expect_error(error: type, function, *args, **kwargs):
+    """
+    Comprueba que la llamada lanza la excepción indicada.
+
+    :param error: Tipo de excepción esperado.
+    :param function: Función a llamar.
+    """
+    try:
+        function(*args, **kwargs)
+    except error:
+        return
+    raise AssertionError(f"Se esperaba {error.__name__} en {function.__name__}.")
+
+
+def check_resume_identical(path: str, seed: int):
+    """
+    Un experimento interrumpido y reanudado da los mismos resultados que uno ininterrumpido.
+    """
+    bandit, algorithms = setup(seed)
+    expected_rewards, expected_optimal = run_experiment(bandit, algorithms, STEPS, RUNS)
+
+    # Interrupción a mitad de la séptima ejecución: el último checkpoint es el de la ejecución 6
+    pulls_per_run = STEPS * len(algorithms)
+    run_interrupted(path, seed, interrupt_after_pulls=6 * pulls_per_run + pulls_per_run // 2)
+    assert os.path.exists(path), "No se ha guardado el checkpoint."
+
+    bandit, algorithms = setup(seed)
+    rewards, optimal = run_experiment(bandit, algorithms, STEPS, RUNS, checkpoint_path=path,
+                                      checkpoint_every=CHECKPOINT_EVERY, seed=seed)
+
+    assert np.array_equal(rewards, expected_rewards), "Las recompensas reanudadas no coinciden."
+    assert np.array_equal(optimal, expected_optimal), "Las selecciones óptimas reanudadas no coinciden."
+    assert not os.path.exists(path), "El checkpoint de un experimento terminado no se ha eliminado."
+
+
+def check_mismatch_rejected(path: str, seed: int):
+    """
+    Un checkpoint de otra configuración (semilla, epsilon, ejecuciones o pasos) se rechaza.
+    """
+    run_interrupted(path, seed, interrupt_after_pulls=4 * STEPS * 3)
+
+    bandit, algorithms = setup(seed + 1)
+    expect_error(ValueError, run_experiment, bandit, algorithms, STEPS, RUNS,
+                 checkpoint_path=path, checkpoint_every=CHECKPOINT_EVERY, seed=seed + 1)
+
+    bandit, algorithms = setup(seed, epsilons=[0, 0.01, 0.2])
+    expect_error(ValueError, run_experiment, bandit, algorithms, STEPS, RUNS,
+                 checkpoint_path=path, checkpoint_every=CHECKPOINT_EVERY, seed=seed)
+    assert algorithms[2].epsilon == 0.2, "El checkpoint no debe modificar epsilon."
+
+    bandit, algorithms = setup(seed)
+    expect_error(ValueError, run_experiment, bandit, algorithms, STEPS, RUNS - 8,
+                 checkpoint_path=path, checkpoint_every=CHECKPOINT_EVERY, seed=seed)
+
+    bandit, algorithms = setup(seed)
+    expect_error(ValueError, run_experiment, bandit, algorithms, STEPS + 1, RUNS,
+                 checkpoint_path=path, checkpoint_every=CHECKPOINT_EVERY, seed=seed)
+
+    assert os.path.exists(path), "Un checkpoint rechazado no debe eliminarse."
+    os.remove(path)
+
+
+def check_checkpoint_every_validated(path: str, seed: int):
+    """
+    checkpoint_every debe ser un entero positivo, tanto en run_experiment como en la línea de comandos.
+    """
+    for checkpoint_every in (0, -1):
+        bandit, algorithms = setup(seed)
+        expect_error(AssertionError, run_experiment, bandit, algorithms, STEPS, RUNS,
+                     checkpoint_path=path, checkpoint_every=checkpoint_every, seed=seed)
+        with contextlib.redirect_stderr(io.StringIO()):
+            expect_error(SystemExit, parse_args, ['--checkpoint-every', str(checkpoint_every)])
+
+    assert parse_args(['--checkpoint-every', '5']).checkpoint_every == 5
+
+
+def main():
+    """
+    Ejecuta todas las comprobaciones en un directorio temporal.
+    """
+    seed = 42
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'experimento.npz')
+        for check in (check_resume_identical, check_mismatch_rejected, check_checkpoint_every_validated):
+            check(path, seed)
+            print(f"OK: {check.__name__}")
+
+
+if __name__ == '__main__':
+    main()
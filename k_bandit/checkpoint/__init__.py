@@ -0,0 +1,19 @@
+"""
+Module: checkpoint/__init__.py
+Description: Contiene las importaciones y modulos/clases públicas del paquete checkpoint.
+
+Author: agent
+Email: agent@local
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+# Importación de módulos o clases
+from .checkpoint import experiment_fingerprint, save_checkpoint, load_checkpoint, clear_checkpoint
+
+# Lista de módulos o clases públicas
+__all__ = ['experiment_fingerprint', 'save_checkpoint', 'load_checkpoint', 'clear_checkpoint']
@@ -0,0 +1,134 @@
+"""
+Module: checkpoint/checkpoint.py
+Description: Funciones para guardar y restaurar el estado parcial de un experimento en un fichero binario (.npz).
+El checkpoint incluye los acumuladores parciales, el estado de cada algoritmo y el estado del generador
+aleatorio de numpy, de modo que un experimento reanudado produce los mismos resultados que uno ininterrumpido.
+También guarda una huella de la configuración del experimento para rechazar checkpoints de otra configuración.
+
+Author: agent
+Email: agent@local
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import json
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from algorithms import Algorithm
+from arms import Bandit
+
+
+def experiment_fingerprint(bandit: Bandit, algorithms: List[Algorithm], steps: int, runs: int,
+                           seed: Optional[int]) -> str:
+    """
+    Genera una huella de la configuración del experimento.
+
+    :param bandit: Instancia de Bandit del experimento.
+    :param algorithms: Lista de instancias de algoritmos del experimento.
+    :param steps: Número de pasos de tiempo por ejecución.
+    :param runs: Número de ejecuciones independientes.
+    :param seed: Semilla con la que se inicializó el generador aleatorio (None si se desconoce).
+    :return: Cadena JSON que identifica la configuración.
+    """
+    config = {
+        'seed': seed,
+        'k': bandit.k,
+        'steps': steps,
+        'runs': runs,
+        'arms': [str(arm) for arm in bandit.arms],
+        'optimal_arm': int(bandit.optimal_arm),
+        'algorithms': [{'class': type(algo).__name__, 'k': algo.k, 'params': algo.get_params()}
+                       for algo in algorithms],
+    }
+    return json.dumps(config, sort_keys=True)
+
+
+def save_checkpoint(path: str, run: int, rewards: np.ndarray, optimal_selections: np.ndarray,
+                    algorithms: List[Algorithm], fingerprint: str):
+    """
+    Guarda el estado parcial de un experimento.
+
+    La escritura se hace sobre un fichero temporal que después reemplaza al original,
+    por lo que una interrupción durante el guardado no corrompe el último checkpoint válido.
+
+    :param path: Ruta del fichero de checkpoint.
+    :param run: Número de ejecuciones ya completadas.
+    :param rewards: Matriz de recompensas acumuladas (sin promediar).
+    :param optimal_selections: Matriz de selecciones óptimas acumuladas (sin promediar).
+    :param algorithms: Lista de instancias de algoritmos del experimento.
+    :param fingerprint: Huella de la configuración generada por experiment_fingerprint.
+    """
+    rng_name, rng_keys, rng_pos, rng_has_gauss, rng_cached_gaussian = np.random.get_state()
+
+    data = {
+        'fingerprint': np.array(fingerprint),
+        'run': np.array(run),
+        'rewards': rewards,
+        'optimal_selections': optimal_selections,
+        'rng_name': np.array(rng_name),
+        'rng_keys': rng_keys,
+        'rng_pos': np.array(rng_pos),
+        'rng_has_gauss': np.array(rng_has_gauss),
+        'rng_cached_gaussian': np.array(rng_cached_gaussian),
+    }
+    for idx, algo in enumerate(algorithms):
+        for key, value in algo.get_state().items():
+            data[f'algo{idx}_{key}'] = value
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez_compressed(f, **data)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str, algorithms: List[Algorithm],
+                    fingerprint: str) -> Optional[Tuple[int, np.ndarray, np.ndarray]]:
+    """
+    Restaura el estado de un experimento a partir de un checkpoint.
+
+    Restaura el estado de cada algoritmo y del generador aleatorio de numpy. Los hiperparámetros
+    de los algoritmos no se restauran: forman parte de la huella y deben coincidir.
+
+    :param path: Ruta del fichero de checkpoint.
+    :param algorithms: Lista de instancias de algoritmos del experimento (se modifican in situ).
+    :param fingerprint: Huella de la configuración actual generada por experiment_fingerprint.
+    :return: Tupla (ejecuciones completadas, recompensas, selecciones óptimas), o None si no existe el fichero.
+    :raises ValueError: Si el checkpoint no corresponde a la configuración del experimento.
+    """
+    if not os.path.exists(path):
+        return None
+
+    with np.load(path) as data:
+        saved = json.loads(str(data['fingerprint']))
+        current = json.loads(fingerprint)
+        if saved != current:
+            differences = sorted(key for key in current.keys() | saved.keys() if saved.get(key) != current.get(key))
+            raise ValueError(f"El checkpoint '{path}' no corresponde a la configuración del experimento "
+                             f"(difiere en: {', '.join(differences)}).")
+
+        for idx, algo in enumerate(algorithms):
+            prefix = f'algo{idx}_'
+            state = {key[len(prefix):]: data[key] for key in data.files if key.startswith(prefix)}
+            algo.set_state(state)
+
+        np.random.set_state((str(data['rng_name']), data['rng_keys'], int(data['rng_pos']),
+                             int(data['rng_has_gauss']), float(data['rng_cached_gaussian'])))
+
+        return int(data['run']), data['rewards'], data['optimal_selections']
+
+
+def clear_checkpoint(path: str):
+    """
+    Elimina el fichero de checkpoint de un experimento terminado, si existe.
+
+    :param path: Ruta del fichero de checkpoint.
+    """
+    if os.path.exists(path):
+        os.remove(path)
@@ -14,27 +14,44 @@ with the additional restriction that it may not be used for commercial purposes.
 For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 
-from typing import List
+import argparse
+from typing import List, Optional
 
 import numpy as np
 
 from algorithms import Algorithm, EpsilonGreedy
 from arms import ArmNormal, Bandit
-from plotting import plot_average_rewards, plot_optimal_selections
+from checkpoint import experiment_fingerprint, save_checkpoint, load_checkpoint, clear_checkpoint
+# El paquete plotting carga matplotlib y seaborn solo al usar una de sus funciones
+import plotting
 
 
-def run_experiment(bandit: Bandit, algorithms: List[Algorithm], steps: int, runs: int):
+def run_experiment(bandit: Bandit, algorithms: List[Algorithm], steps: int, runs: int,
+                   checkpoint_path: Optional[str] = None, checkpoint_every: int = 10,
+                   seed: Optional[int] = None):
     """
     Ejecuta experimentos comparativos entre diferentes algoritmos.
 
+    Si se indica checkpoint_path, el estado parcial del experimento se guarda cada checkpoint_every
+    ejecuciones y, si el fichero ya existe, el experimento se reanuda desde el último checkpoint.
+    El checkpoint solo se acepta si fue generado con la misma configuración (semilla, brazos,
+    algoritmos y sus parámetros, pasos y ejecuciones), y se elimina al terminar el experimento.
+
     :param bandit: Instancia de Bandit configurada para el experimento.
     :param algorithms: Lista de instancias de algoritmos a comparar.
     :param steps: Número de pasos de tiempo por ejecución.
     :param runs: Número de ejecuciones independientes.
+    :param checkpoint_path: Opcional. Ruta del fichero de checkpoint.
+    :param checkpoint_every: Número de ejecuciones entre checkpoints (mayor que 0).
+    :param seed: Opcional. Semilla con la que se inicializó el generador aleatorio; forma parte de la
+        configuración que se valida al reanudar.
+    :raises ValueError: Si el checkpoint no corresponde a la configuración del experimento.
     :return: Tuple de tres elementos: recompensas promedio, porcentaje de selecciones óptimas, y estadísticas de brazos.
     :rtype: Tuple of (np.ndarray, np.ndarray, list)
     """
 
+    assert checkpoint_every > 0, "El parámetro checkpoint_every debe ser mayor que 0."
+
     k = bandit.k
     optimal_arm = bandit.optimal_arm
 
@@ -42,8 +59,18 @@ def run_experiment(bandit: Bandit, algorithms: List[Algorithm], steps: int, runs
     rewards = np.zeros((len(algorithms), steps))
     optimal_selections = np.zeros((len(algorithms), steps))
 
-
-    for run in range(runs):
+    start_run = 0
+    if checkpoint_path is not None:
+        fingerprint = experiment_fingerprint(bandit, algorithms, steps, runs, seed)
+        checkpoint = load_checkpoint(checkpoint_path, algorithms, fingerprint)
+        if checkpoint is not None:
+            start_run, rewards, optimal_selections = checkpoint
+            # Los checkpoints solo se guardan con ejecuciones pendientes
+            if not 0 < start_run < runs:
+                raise ValueError(f"El checkpoint '{checkpoint_path}' indica {start_run} ejecuciones completadas "
+                                 f"de un total de {runs}.")
+
+    for run in range(start_run, runs):
         # Crear una nueva instancia del bandit para cada ejecución
         current_bandit = Bandit(arms=bandit.arms)
 
@@ -71,6 +98,13 @@ def run_experiment(bandit: Bandit, algorithms: List[Algorithm], steps: int, runs
                 if chosen_arm == optimal_arm:
                     optimal_selections[idx, step] += 1
 
+        if checkpoint_path is not None and (run + 1) % checkpoint_every == 0 and run + 1 < runs:
+            save_checkpoint(checkpoint_path, run + 1, rewards, optimal_selections, algorithms, fingerprint)
+
+    # Un experimento terminado no deja checkpoint: una nueva invocación vuelve a simular
+    if checkpoint_path is not None:
+        clear_checkpoint(checkpoint_path)
+
     # Promediar las recompensas y el regret sobre todas las ejecuciones
     rewards /= runs
     optimal_selections = (optimal_selections / runs) * 100
@@ -80,17 +114,57 @@ def run_experiment(bandit: Bandit, algorithms: List[Algorithm], steps: int, runs
 
 
 
-def main():
+def positive_int(value: str) -> int:
+    """
+    Tipo de argparse para enteros estrictamente positivos.
+
+    :param value: Valor del argumento como cadena.
+    :return: Valor convertido a entero.
+    :raises argparse.ArgumentTypeError: Si el valor no es un entero mayor que 0.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{value}' no es un entero.")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"'{value}' debe ser mayor que 0.")
+    return number
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Analiza los argumentos de línea de comandos del experimento.
+
+    :param argv: Opcional. Lista de argumentos (por defecto, sys.argv).
+    :return: Argumentos analizados.
+    """
+    parser = argparse.ArgumentParser(description="Experimento comparativo de algoritmos en el problema del bandido de k-brazos.")
+    parser.add_argument('--seed', type=int, default=42, help="Semilla del generador aleatorio.")
+    parser.add_argument('--k', type=int, default=10, help="Número de brazos.")
+    parser.add_argument('--steps', type=int, default=1000, help="Número de pasos.")
+    parser.add_argument('--runs', type=int, default=500, help="Número de ejecuciones.")
+    parser.add_argument('--checkpoint', default=None, help="Fichero de checkpoint para guardar y reanudar el experimento.")
+    parser.add_argument('--checkpoint-every', type=positive_int, default=10, help="Número de ejecuciones entre checkpoints.")
+    parser.add_argument('--no-plot', action='store_true', help="No genera gráficas (no importa matplotlib ni seaborn).")
+    return parser.parse_args(argv)
+
+
+def main(args: Optional[argparse.Namespace] = None):
     """
     Main function to set up and execute comparative experiments.
+
+    :param args: Opcional. Argumentos generados por parse_args; si no se indican se usan los valores
+        por defecto (sin leer sys.argv, de modo que puede llamarse desde un notebook).
     """
+    if args is None:
+        args = parse_args([])
 
-    seed = 42
+    seed = args.seed
     np.random.seed(seed)
 
-    k = 10 # Número de brazos
-    steps = 1000  # Número de pasos
-    runs = 500  # Número de ejecuciones
+    k = args.k  # Número de brazos
+    steps = args.steps  # Número de pasos
+    runs = args.runs  # Número de ejecuciones
 
     bandit = Bandit(arms=ArmNormal.generate_arms(k))  # Bandit(arms=ArmBinomial.generate_arms(k))
     # bandit = Bandit(arms=ArmBernoulli.generate_arms(k))  # Bandit(arms=ArmBinomial.generate_arms(k))
@@ -102,12 +176,18 @@ def main():
     algorithms = [EpsilonGreedy(k=k, epsilon=0), EpsilonGreedy(k=k, epsilon=0.01), EpsilonGreedy(k=k, epsilon=0.1)]
 
     # Ejecutar el experimento y obtener las recompensas promedio y selecciones óptimas
-    rewards, optimal_selections = run_experiment(bandit, algorithms, steps, runs)
+    rewards, optimal_selections = run_experiment(bandit, algorithms, steps, runs,
+                                                 checkpoint_path=args.checkpoint,
+                                                 checkpoint_every=args.checkpoint_every,
+                                                 seed=seed)
+
+    if args.no_plot:
+        return
 
     # Generar las gráficas utilizando las funciones externas
-    plot_average_rewards(steps, rewards, algorithms)
+    plotting.plot_average_rewards(steps, rewards, algorithms)
 
-    # plot_optimal_selections(steps, optimal_selections, algorithms)
+    # plotting.plot_optimal_selections(steps, optimal_selections, algorithms)
 
 
 
@@ -115,6 +195,6 @@ def main():
 
 # Press the green button in the gutter to run the script.
 if __name__ == '__main__':
-    main()
+    main(parse_args())
 
 # See PyCharm help at https://www.jetbrains.com/help/pycharm/
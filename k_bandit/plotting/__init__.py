@@ -12,9 +12,33 @@ with the additional restriction that it may not be used for commercial purposes.
 For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 
-# Importación de módulos o clases
-from .plotting import plot_average_rewards, plot_optimal_selections, plot_arm_statistics, plot_regret
+import importlib
 
 # Lista de módulos o clases públicas
 __all__ = ['plot_average_rewards', 'plot_optimal_selections', 'plot_arm_statistics', 'plot_regret']
 
+
+def __getattr__(name: str):
+    """
+    Importa el módulo plotting (y con él seaborn y matplotlib) solo en el primer acceso a una función pública,
+    de modo que importar el paquete no carga las dependencias de gráficas.
+
+    :param name: Nombre del atributo solicitado.
+    :return: Función de gráficas solicitada.
+    :raises AttributeError: Si el atributo no es público en el paquete.
+    """
+    if name in __all__:
+        module = importlib.import_module('.plotting', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """
+    Incluye las funciones públicas cargadas de forma diferida en dir() y en el autocompletado.
+
+    :return: Lista de nombres del paquete.
+    """
+    return sorted(set(globals()) | set(__all__))